@@ -157,6 +157,20 @@ def _to_numpy(data: Any) -> np.ndarray:
     array
         The C contiguous NumPy array.
     """
+    # A Python range can be converted directly without iterating over its elements.
+    if isinstance(data, range):
+        return np.arange(data.start, data.stop, data.step)
+
+    # NumPy arrays that are already C contiguous need no conversion. np.object_ arrays
+    # are excluded since they may be converted to np.str_ below.
+    if (
+        type(data) is np.ndarray
+        and data.ndim > 0
+        and data.flags.c_contiguous
+        and data.dtype != np.object_
+    ):
+        return data
+
     # Mapping of unsupported dtypes to expected NumPy dtypes.
     dtypes: dict[str, type | str] = {
         # For string dtypes.
@@ -395,8 +395,9 @@ def meca(  # noqa: PLR0912, PLR0913, PLR0915
             # convert values to ndarray so pandas doesn't complain about "all
             # scalar values". See
             # https://github.com/GenericMappingTools/pygmt/pull/2174
+            # Use copy=False so that existing numpy arrays are not copied again.
             spec = pd.DataFrame(
-                {key: np.atleast_1d(value) for key, value in spec.items()}
+                {key: np.atleast_1d(value) for key, value in spec.items()}, copy=False
             )
     elif isinstance(spec, np.ndarray):  # spec is a numpy array
         if convention is None:
@@ -31,7 +31,10 @@ def which(fname, **kwargs) -> str | list[str]:
     Parameters
     ----------
     fname : str or list
-        One or more file names of any data type (grids, tables, etc.).
+        One or more file names of any data type (grids, tables, etc.). When
+        resolving many files, pass them all at once as a list rather than
+        calling ``which`` once per file, so that they are looked up in a
+        single GMT call.
     download : bool or str
         [**a**\|\ **c**\|\ **l**\|\ **u**].
         If the ``fname`` argument is a downloadable file (either a complete
@@ -63,9 +66,11 @@ def which(fname, **kwargs) -> str | list[str]:
                 module="which",
                 args=build_arg_list(kwargs, infile=fname, outfile=vouttbl),
             )
-            paths = lib.virtualfile_to_dataset(vfname=vouttbl, output_type="strings")
+            paths = lib.virtualfile_to_dataset(
+                vfname=vouttbl, output_type="strings"
+            ).tolist()
 
-    match paths.size:
+    match len(paths):
         case 0:
             _fname = "', '".join(fname) if is_nonstr_iter(fname) else fname
             msg = f"File(s) '{_fname}' not found."
@@ -73,4 +78,4 @@ def which(fname, **kwargs) -> str | list[str]:
         case 1:
             return paths[0]
         case _:
-            return paths.tolist()
+            return paths
@@ -69,6 +69,14 @@ def _check_result(result, expected_dtype):
             id="complex",
         ),
         pytest.param(["abc", "defg", "12345"], np.str_, id="string"),
+        # TODO(NumPy>=2.0): Remove the if-else statement after NumPy>=2.0.
+        pytest.param(
+            range(1, 10, 3),
+            np.int32
+            if sys.platform == "win32" and Version(np.__version__) < Version("2.0")
+            else np.int64,
+            id="range",
+        ),
     ],
 )
 def test_to_numpy_python_types(data, expected_dtype):
@@ -142,6 +150,18 @@ def test_to_numpy_numpy_numeric(dtype, expected_dtype):
     npt.assert_array_equal(result, array, strict=True)
 
 
+@pytest.mark.parametrize(("dtype", "expected_dtype"), np_dtype_params)
+def test_to_numpy_numpy_numeric_c_contiguous(dtype, expected_dtype):
+    """
+    Test that the _to_numpy function returns C-contiguous NumPy arrays without copying.
+    """
+    array = np.array([1, 2, 3, 4, 5, 6], dtype=dtype)
+    assert array.flags.c_contiguous is True
+    result = _to_numpy(array)
+    _check_result(result, expected_dtype)
+    assert result is array
+
+
 @pytest.mark.parametrize("dtype", [None, np.str_, "U10"])
 def test_to_numpy_numpy_string(dtype):
     """
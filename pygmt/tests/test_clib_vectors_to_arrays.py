@@ -22,12 +22,10 @@ def _check_arrays(arrays):
     - Check if all arrays are numpy arrays
     - Check if all arrays are 1-D
     """
-    # Check if all arrays are C-contiguous
-    assert all(i.flags.c_contiguous for i in arrays)
-    # Check if all arrays are numpy arrays
-    assert all(isinstance(i, np.ndarray) for i in arrays)
-    # Check if all arrays are 1-D
-    assert all(i.ndim == 1 for i in arrays)
+    for array in arrays:
+        assert isinstance(array, np.ndarray)
+        assert array.flags.c_contiguous
+        assert array.ndim == 1
 
 
 @pytest.mark.parametrize(